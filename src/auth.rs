@@ -1,11 +1,16 @@
-use crate::{config::atomic_json, model::Account};
+use crate::{
+    config::{atomic_write, json_bytes},
+    model::Account,
+};
 use anyhow::{bail, Result};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::{
-    collections::BTreeMap,
+    cell::Cell,
+    collections::{hash_map::DefaultHasher, BTreeMap},
     fs,
-    path::{Path, PathBuf},
+    hash::{Hash, Hasher},
+    path::PathBuf,
 };
 
 #[derive(Clone, Debug, Default, Serialize, Deserialize)]
@@ -23,27 +28,36 @@ pub struct AuthManager {
     pub accounts: Vec<Account>,
     pub active_index: usize,
     extra: BTreeMap<String, Value>,
+    saved: Cell<Option<u64>>,
 }
 impl AuthManager {
     pub fn new(auth_path: impl Into<PathBuf>) -> Self {
         let auth_path = auth_path.into();
-        let loaded = load(&auth_path).unwrap_or_default();
+        let bytes = fs::read(&auth_path).ok();
+        let loaded = bytes.as_deref().and_then(load).unwrap_or_default();
         Self {
             auth_path,
             accounts: loaded.accounts,
             active_index: loaded.active_index,
             extra: loaded.extra,
+            saved: Cell::new(bytes.as_deref().map(digest)),
         }
     }
+    /// Writes accounts atomically, skipping the write (and its fsync) when the
+    /// file already holds exactly this payload.
     pub fn save_accounts(&self) -> Result<()> {
-        atomic_json(
-            &self.auth_path,
-            &AccountsFile {
-                accounts: self.accounts.clone(),
-                active_index: self.active_index,
-                extra: self.extra.clone(),
-            },
-        )
+        let bytes = json_bytes(&AccountsFile {
+            accounts: self.accounts.clone(),
+            active_index: self.active_index,
+            extra: self.extra.clone(),
+        })?;
+        let digest = digest(&bytes);
+        if self.saved.get() == Some(digest) && self.auth_path.exists() {
+            return Ok(());
+        }
+        atomic_write(&self.auth_path, &bytes)?;
+        self.saved.set(Some(digest));
+        Ok(())
     }
     pub fn supported_accounts(&self) -> impl Iterator<Item = (usize, &Account)> {
         self.accounts
@@ -153,8 +167,13 @@ impl AuthManager {
         Ok(true)
     }
 }
-fn load(path: &Path) -> Option<AccountsFile> {
-    let mut root = serde_json::from_slice::<Value>(&fs::read(path).ok()?).ok()?;
+fn digest(bytes: &[u8]) -> u64 {
+    let mut hasher = DefaultHasher::new();
+    bytes.hash(&mut hasher);
+    hasher.finish()
+}
+fn load(bytes: &[u8]) -> Option<AccountsFile> {
+    let mut root = serde_json::from_slice::<Value>(bytes).ok()?;
     let object = root.as_object_mut()?;
     let accounts = object
         .remove("accounts")
@@ -237,6 +237,18 @@ pub fn run() -> Result<()> {
         }
     }
 }
+/// Index of the only supported account matching `id` by email, identity or
+/// alias; stops scanning at the second match.
+fn unique_account(auth: &AuthManager, id: &str) -> Option<usize> {
+    let mut matches = auth
+        .supported_accounts()
+        .filter(|(_, x)| x.email == id || x.identity() == id || x.alias.as_deref() == Some(id))
+        .map(|(i, _)| i);
+    match (matches.next(), matches.next()) {
+        (Some(index), None) => Some(index),
+        _ => None,
+    }
+}
 fn show(a: ShowArgs) -> Result<()> {
     let config = Config::new(None);
     let mut auth = AuthManager::new(config.auth_path());
@@ -244,15 +256,10 @@ fn show(a: ShowArgs) -> Result<()> {
         return login(&mut auth, &a);
     }
     if let Some(id) = &a.select_account {
-        let matches = auth
-            .supported_accounts()
-            .filter(|(_, x)| x.email == *id || x.identity() == id || x.alias.as_deref() == Some(id))
-            .map(|(i, _)| i)
-            .collect::<Vec<_>>();
-        if matches.len() != 1 {
+        let Some(index) = unique_account(&auth, id) else {
             return status(&a, "error", "Account not found or ambiguous");
-        }
-        auth.active_index = matches[0];
+        };
+        auth.active_index = index;
         auth.save_accounts()?;
         return status(&a, "success", &format!("Selected account {id}"));
     }
@@ -265,22 +272,14 @@ fn show(a: ShowArgs) -> Result<()> {
                     "--logout requires interactive confirmation in non-interactive mode",
                 );
             }
-            let matches = auth
-                .supported_accounts()
-                .filter(|(_, account)| {
-                    account.email == *id
-                        || account.identity() == id
-                        || account.alias.as_deref() == Some(id)
-                })
-                .map(|(_, account)| account.clone())
-                .collect::<Vec<_>>();
-            if matches.len() != 1 {
+            let Some(index) = unique_account(&auth, id) else {
                 return status(&a, "error", "Account not found or ambiguous");
-            }
-            let label = matches[0]
+            };
+            let account = &auth.accounts[index];
+            let label = account
                 .alias
                 .as_deref()
-                .unwrap_or(&matches[0].email)
+                .unwrap_or(&account.email)
                 .to_owned();
             if !matches!(
                 prompt(&format!("Log out {label}? [y/N]: "))?
@@ -574,8 +573,10 @@ fn show(a: ShowArgs) -> Result<()> {
             io::stdout().is_terminal(),
             std::env::var_os("NO_COLOR").is_some(),
         );
+        // Rendered rows go to stdout in one write instead of one per line.
+        let mut out = String::new();
         if a.query.is_empty() && !a.compact {
-            print!("{}", display::main_header(color));
+            out += display::main_header(color);
         }
         for mut f in fetched {
             if let Some(e) = f.error.as_deref() {
@@ -584,17 +585,14 @@ fn show(a: ShowArgs) -> Result<()> {
                 if !a.query.is_empty() {
                     continue;
                 }
-                print!(
-                    "{}",
-                    display::render_fetch_error(
-                        &f.account.email,
-                        f.account.alias.as_deref(),
-                        f.account.group.as_deref(),
-                        f.client.as_ref().map(|x| x.provider()),
-                        e,
-                        a.compact,
-                        color,
-                    )
+                out += &display::render_fetch_error(
+                    &f.account.email,
+                    f.account.alias.as_deref(),
+                    f.account.group.as_deref(),
+                    f.client.as_ref().map(|x| x.provider()),
+                    e,
+                    a.compact,
+                    color,
                 );
                 continue;
             }
@@ -607,37 +605,33 @@ fn show(a: ShowArgs) -> Result<()> {
                 continue;
             }
             if f.quotas.is_empty() {
-                print!(
-                    "{}",
-                    display::render_quotas(
-                        &f.account.email,
-                        f.account.alias.as_deref(),
-                        f.account.group.as_deref(),
-                        c.provider(),
-                        vec![],
-                        a.compact,
-                        color,
-                    )
+                out += &display::render_quotas(
+                    &f.account.email,
+                    f.account.alias.as_deref(),
+                    f.account.group.as_deref(),
+                    c.provider(),
+                    vec![],
+                    a.compact,
+                    color,
                 );
-                println!("{}", display::empty_message(&original_quotas, a.show_all));
+                out += display::empty_message(&original_quotas, a.show_all);
+                out.push('\n');
             } else {
-                print!(
-                    "{}",
-                    display::render_quotas(
-                        &f.account.email,
-                        f.account.alias.as_deref(),
-                        f.account.group.as_deref(),
-                        c.provider(),
-                        f.quotas,
-                        a.compact,
-                        color,
-                    )
+                out += &display::render_quotas(
+                    &f.account.email,
+                    f.account.alias.as_deref(),
+                    f.account.group.as_deref(),
+                    c.provider(),
+                    f.quotas,
+                    a.compact,
+                    color,
                 );
             }
             if !a.compact {
-                print!("{}", display::separator(color));
+                out += display::separator(color);
             }
         }
+        print!("{out}");
     }
     if !a.query.is_empty() && !matched {
         bail!("No quotas matched query")
@@ -753,7 +747,7 @@ fn choice_index(value: &str, len: usize) -> Option<usize> {
     } else {
         value.parse().ok()?
     };
-    (choice > 0 && choice <= len).then_some(choice - 1)
+    (choice > 0 && choice <= len).then(|| choice - 1)
 }
 
 fn logout_all(auth: &mut AuthManager, a: &ShowArgs) -> Result<()> {
@@ -904,11 +898,12 @@ fn login(auth: &mut AuthManager, a: &ShowArgs) -> Result<()> {
         .as_deref()
         .and_then(|x| serde_json::from_str(x).ok())
         .unwrap_or(Value::Null);
+    // One pooled client serves both GitHub discovery and the login request.
+    let http = match crate::quota_client::SharedHttp::new() {
+        Ok(http) => http,
+        Err(error) => return action_error(a, error),
+    };
     if p == "github_copilot" && input.is_null() {
-        let http = match crate::quota_client::SharedHttp::new() {
-            Ok(http) => http,
-            Err(error) => return action_error(a, error),
-        };
         input = match github_login_input(&http, &Proc, &RequestContext::default()) {
             Ok(input) => input,
             Err(error) => return action_error(a, error),
@@ -920,10 +915,6 @@ fn login(auth: &mut AuthManager, a: &ShowArgs) -> Result<()> {
             prompt("Enter OpenRouter API key: ")
         })?;
     }
-    let http = match crate::quota_client::SharedHttp::new() {
-        Ok(http) => http,
-        Err(error) => return action_error(a, error),
-    };
     let mut account = match futures::executor::block_on(client.login(
         input,
         &http,
@@ -992,12 +983,7 @@ fn github_login_input(
             eprintln!("{}) {user}", i + 1);
         }
         let choice = prompt("Enter choice [1]: ")?;
-        let index: usize = if choice.is_empty() {
-            1
-        } else {
-            choice.parse().unwrap_or(0)
-        };
-        selected = accounts.get(index.saturating_sub(1)).cloned();
+        selected = choice_index(&choice, accounts.len()).map(|i| accounts[i].clone());
         if selected.is_none() {
             bail!("A GitHub account selection is required")
         }
@@ -1275,6 +1261,44 @@ fn print_ok(s: String) -> Result<()> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn unique_account_requires_exactly_one_supported_match() {
+        let dir = tempfile::tempdir().unwrap();
+        let mut auth = AuthManager::new(dir.path().join("accounts.json"));
+        for (kind, email, alias) in [
+            ("openai", "a@example.com", Some("work")),
+            ("openrouter", "b@example.com", Some("work")),
+            ("openai", "c@example.com", None),
+            ("google", "d@example.com", None),
+        ] {
+            auth.accounts.push(Account {
+                provider_type: kind.into(),
+                email: email.into(),
+                alias: alias.map(Into::into),
+                ..Default::default()
+            });
+        }
+        assert_eq!(unique_account(&auth, "c@example.com"), Some(2));
+        assert_eq!(unique_account(&auth, "work"), None);
+        assert_eq!(unique_account(&auth, "d@example.com"), None);
+        assert_eq!(unique_account(&auth, "nobody"), None);
+    }
+
+    #[test]
+    fn menu_choices_default_to_the_first_entry_and_reject_invalid_input() {
+        // Shared by the provider, logout, and gh account menus.
+        for (choice, expected) in [
+            ("", Some(0)),
+            ("1", Some(0)),
+            ("3", Some(2)),
+            ("0", None),
+            ("abc", None),
+            ("4", None),
+        ] {
+            assert_eq!(choice_index(choice, 3), expected, "{choice:?}");
+        }
+    }
+
     #[test]
     fn openrouter_key_input_is_tty_only_and_preserves_explicit_input() {
         let prompted = std::cell::Cell::new(false);
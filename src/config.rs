@@ -92,12 +92,19 @@ fn expand_home(value: &str) -> PathBuf {
         .and_then(|p| dirs::home_dir().map(|h| h.join(p)))
         .unwrap_or_else(|| PathBuf::from(value))
 }
+pub(crate) fn json_bytes<T: Serialize>(value: &T) -> Result<Vec<u8>> {
+    let mut bytes = serde_json::to_vec_pretty(value)?;
+    bytes.push(b'\n');
+    Ok(bytes)
+}
 pub(crate) fn atomic_json<T: Serialize>(path: &Path, value: &T) -> Result<()> {
+    atomic_write(path, &json_bytes(value)?)
+}
+pub(crate) fn atomic_write(path: &Path, bytes: &[u8]) -> Result<()> {
     let parent = path.parent().context("path has no parent")?;
     fs::create_dir_all(parent)?;
     let mut temp = tempfile::NamedTempFile::new_in(parent)?;
-    serde_json::to_writer_pretty(&mut temp, value)?;
-    temp.write_all(b"\n")?;
+    temp.write_all(bytes)?;
     temp.as_file().sync_all()?;
     temp.persist(path).map_err(|e| e.error)?;
     Ok(())
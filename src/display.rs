@@ -4,16 +4,25 @@
 //! Rust equivalent here, so layout is intentionally fixed plain text with
 //! small ANSI spans layered on top when stdout is a terminal.
 
-use crate::{model::Quota, providers::base::Provider};
-use chrono::{DateTime, TimeZone, Utc};
+use crate::{
+    model::Quota,
+    providers::base::{epoch_datetime, Provider},
+};
+use chrono::{DateTime, Utc};
+use std::fmt::Write as _;
 
 pub fn query_filter(mut quotas: Vec<Quota>, queries: &[String]) -> Vec<Quota> {
-    for query in queries {
-        let q = query.to_lowercase();
-        quotas.retain(|x| {
-            x.name.to_lowercase().contains(&q) || x.display_name.to_lowercase().contains(&q)
-        });
+    if queries.is_empty() {
+        return quotas;
     }
+    let queries: Vec<_> = queries.iter().map(|q| q.to_lowercase()).collect();
+    quotas.retain(|x| {
+        let name = x.name.to_lowercase();
+        let display_name = x.display_name.to_lowercase();
+        queries
+            .iter()
+            .all(|q| name.contains(q) || display_name.contains(q))
+    });
     quotas
 }
 fn pct(q: &Quota) -> (f64, bool) {
@@ -35,22 +44,7 @@ fn reset(q: &Quota, now: DateTime<Utc>) -> String {
     let Some(value) = q.reset_time.as_deref() else {
         return String::new();
     };
-    let dt = DateTime::parse_from_rfc3339(&value.replace('Z', "+00:00"))
-        .map(|x| x.with_timezone(&Utc))
-        .ok()
-        .or_else(|| {
-            value.parse::<f64>().ok().and_then(|mut x| {
-                if x.abs() > 10_000_000_000.0 {
-                    x /= 1000.0;
-                }
-                let seconds = x.trunc() as i64;
-                let nanos = ((x - seconds as f64) * 1_000_000_000.0)
-                    .round()
-                    .clamp(0.0, 999_999_999.0) as u32;
-                Utc.timestamp_opt(seconds, nanos).single()
-            })
-        });
-    let Some(dt) = dt else {
+    let Some(dt) = parse_reset(value) else {
         return String::new();
     };
     let seconds = (dt - now).num_seconds();
@@ -59,6 +53,17 @@ fn reset(q: &Quota, now: DateTime<Utc>) -> String {
     }
     format_countdown(seconds)
 }
+fn parse_reset(value: &str) -> Option<DateTime<Utc>> {
+    // RFC 3339 always has the year's dash at byte 4; anything else can only
+    // be an epoch value. chrono accepts a trailing `Z` directly, so the
+    // timestamp is parsed in place rather than through a rewritten copy.
+    if value.as_bytes().get(4) == Some(&b'-') {
+        return DateTime::parse_from_rfc3339(value)
+            .ok()
+            .map(|dt| dt.with_timezone(&Utc));
+    }
+    epoch_datetime(value.parse().ok()?)
+}
 fn format_countdown(seconds: i64) -> String {
     if seconds <= 0 {
         return String::new();
@@ -66,42 +71,48 @@ fn format_countdown(seconds: i64) -> String {
     let (d, r) = (seconds / 86400, seconds % 86400);
     let (h, r) = (r / 3600, r % 3600);
     let m = r / 60;
-    let mut p = Vec::new();
+    let mut out = String::from(" (");
     if d > 0 {
-        p.push(format!("{d}d"))
+        let _ = write!(out, "{d}d ");
     }
     if h > 0 {
-        p.push(format!("{h}h"))
+        let _ = write!(out, "{h}h ");
     }
-    if m > 0 || p.is_empty() {
-        p.push(format!("{m}m"))
+    if m > 0 || (d == 0 && h == 0) {
+        let _ = write!(out, "{m}m ");
     }
-    format!(" ({})", p.join(" "))
+    out.pop();
+    out.push(')');
+    out
 }
-fn normal_bar_width() -> usize {
+fn columns() -> usize {
     std::env::var("COLUMNS")
         .ok()
         .and_then(|value| value.parse::<usize>().ok())
         .unwrap_or(80)
-        .saturating_sub(50)
-        .clamp(10, 60)
 }
+fn normal_bar_width() -> usize {
+    columns().saturating_sub(50).clamp(10, 60)
+}
+fn compact_bar_width() -> usize {
+    let prefix_width = 2 + 10 + 2;
+    columns().saturating_sub(prefix_width + 30).clamp(5, 30)
+}
+const EIGHTHS: [&str; 8] = ["", "▏", "▎", "▍", "▌", "▋", "▊", "▉"];
 fn bar(value: f64, width: usize, compact: bool) -> String {
-    let value = value.clamp(0.0, 100.0);
-    let n = (value * width as f64 / 100.0) as usize;
-    let remainder = value * width as f64 / 100.0 - n as f64;
-    let fractions = ["", "▏", "▎", "▍", "▌", "▋", "▊", "▉"];
+    let eighths = (value.clamp(0.0, 100.0) * width as f64 * 8.0 / 100.0) as usize;
+    let n = (eighths / 8).min(width);
     let fraction = if compact || n >= width {
         ""
     } else {
-        fractions[(remainder * 8.0) as usize]
+        EIGHTHS[eighths % 8]
     };
-    format!(
-        "{}{}{}",
-        "█".repeat(n),
-        fraction,
-        " ".repeat(width - n - usize::from(!fraction.is_empty()))
-    )
+    let blank = width - n - usize::from(!fraction.is_empty());
+    let mut out = String::with_capacity(n * '█'.len_utf8() + fraction.len() + blank);
+    out.extend(std::iter::repeat_n('█', n));
+    out.push_str(fraction);
+    out.extend(std::iter::repeat_n(' ', blank));
+    out
 }
 fn progress(raw: &str, color: &str, ansi: bool) -> String {
     let styled_width = raw.trim_end().chars().count();
@@ -117,6 +128,16 @@ fn progress(raw: &str, color: &str, ansi: bool) -> String {
         &raw[split..]
     )
 }
+fn bar_color(p: f64, used: bool) -> &'static str {
+    const REMAINING: [&str; 3] = ["red", "yellow", "green"];
+    const USED: [&str; 3] = ["green", "yellow", "red"];
+    let band = usize::from(p > 20.0) + usize::from(p > 50.0);
+    if used {
+        USED[band]
+    } else {
+        REMAINING[band]
+    }
+}
 fn color_code(color: &str) -> &'static str {
     match color {
         "red" => "31",
@@ -137,15 +158,22 @@ pub fn color_enabled(is_terminal: bool, no_color: bool) -> bool {
     is_terminal && !no_color
 }
 
-pub fn main_header(color: bool) -> String {
-    format!("\n{}\n", styled("Quota Status", "1;34", color))
+const MAIN_HEADER: &str = "\nQuota Status\n";
+const MAIN_HEADER_ANSI: &str = "\n\x1b[1;34mQuota Status\x1b[0m\n";
+// Rich's heavy rule is deliberately rendered as plain text in the Rust
+// implementation; unlike Rich, it does not have a box/style abstraction.
+const SEPARATOR: &str = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n";
+
+pub fn main_header(color: bool) -> &'static str {
+    if color {
+        MAIN_HEADER_ANSI
+    } else {
+        MAIN_HEADER
+    }
 }
 
-pub fn separator(_color: bool) -> String {
-    // Rich's heavy rule is deliberately rendered as plain text in the Rust
-    // implementation; unlike Rich, it does not have a box/style abstraction.
-    let value = "━".repeat(50);
-    format!("{value}\n")
+pub fn separator(_color: bool) -> &'static str {
+    SEPARATOR
 }
 
 pub fn empty_message(quotas: &[Quota], show_all: bool) -> &'static str {
@@ -250,7 +278,7 @@ pub fn render_quotas_at(
     color: bool,
     now: DateTime<Utc>,
 ) -> String {
-    quotas.sort_by_key(|q| provider.sort_key(q));
+    quotas.sort_by_cached_key(|q| provider.sort_key(q));
     let mut out = format!(
         "{}\n",
         styled(
@@ -259,6 +287,18 @@ pub fn render_quotas_at(
             color
         )
     );
+    // Per-account pieces are the same on every row; only build them once.
+    let indicator = styled(
+        &provider.short_indicator().to_string(),
+        color_code(provider.primary_color()),
+        color,
+    );
+    let account = compact_account(email, alias);
+    let bar_width = if compact {
+        compact_bar_width()
+    } else {
+        normal_bar_width()
+    };
     for q in quotas {
         let name = quota_name(&q);
         if q.extra.get("is_error").and_then(|v| v.as_bool()) == Some(true) {
@@ -277,14 +317,9 @@ pub fn render_quotas_at(
             let warning = styled(&format!("⚠️ {m}"), "31", color);
             let link = styled(&link, "2", color);
             if compact {
-                let account = compact_account(email, alias);
                 out += &format!(
                     "{} {:10}: {}: {}{}\n",
-                    styled(
-                        &provider.short_indicator().to_string(),
-                        color_code(provider.primary_color()),
-                        color
-                    ),
+                    indicator,
                     account,
                     compact_name(name),
                     warning,
@@ -304,14 +339,9 @@ pub fn render_quotas_at(
         if q.extra.get("show_progress").and_then(|v| v.as_bool()) == Some(false) {
             let suffix = usage_label.map_or(String::new(), |x| format!(" {x}"));
             if compact {
-                let account = compact_account(email, alias);
                 out += &format!(
                     "{} {:10}: {}{}\n",
-                    styled(
-                        &provider.short_indicator().to_string(),
-                        color_code(provider.primary_color()),
-                        color
-                    ),
+                    indicator,
                     account,
                     compact_name(name),
                     suffix
@@ -326,40 +356,17 @@ pub fn render_quotas_at(
             continue;
         }
         let (p, used) = pct(&q);
-        let bar_color = if p <= 20.0 {
-            if used {
-                "green"
-            } else {
-                "red"
-            }
-        } else if p <= 50.0 {
-            "yellow"
-        } else if used {
-            "red"
-        } else {
-            "green"
-        };
+        let bar_color = bar_color(p, used);
         let percentage_text =
             usage_label.unwrap_or_else(|| format!("{p:5.1}%{}", if used { " used" } else { "" }));
         let percentage = styled(&percentage_text, color_code(bar_color), color);
         let countdown = styled(&reset(&q, now), "2", color);
         if compact {
-            let account = compact_account(email, alias);
-            let columns = std::env::var("COLUMNS")
-                .ok()
-                .and_then(|value| value.parse::<usize>().ok())
-                .unwrap_or(80);
-            let prefix_width = 2 + 10 + 2;
-            let bar_width = columns.saturating_sub(prefix_width + 30).clamp(5, 30);
             let raw = bar(p, bar_width, true);
             let progress = progress(&raw, bar_color, color);
             out += &format!(
                 "{} {:10}: {:18} {} {}{}\n",
-                styled(
-                    &provider.short_indicator().to_string(),
-                    color_code(provider.primary_color()),
-                    color
-                ),
+                indicator,
                 account,
                 compact_name(name).chars().take(18).collect::<String>(),
                 progress,
@@ -370,7 +377,7 @@ pub fn render_quotas_at(
             out += &format!(
                 "{} {} {}{}\n",
                 styled(&format!("{name:22}"), color_code(provider.color(&q)), color),
-                progress(&bar(p, normal_bar_width(), false), bar_color, color),
+                progress(&bar(p, bar_width, false), bar_color, color),
                 percentage,
                 countdown
             );
@@ -467,6 +474,7 @@ fn format_number(value: f64) -> String {
 mod tests {
     use super::*;
     use crate::{model::Account, providers};
+    use chrono::TimeZone;
     use serde_json::json;
 
     fn provider(kind: &str) -> Box<dyn Provider> {
@@ -518,6 +526,7 @@ mod tests {
 
     #[test]
     fn ansi_only_decorates_bar_and_errors_have_no_separator_or_countdown() {
+        let copilot = provider("github_copilot");
         let quota = Quota {
             display_name: "Personal".into(),
             remaining_pct: Some(50.0),
@@ -527,20 +536,12 @@ mod tests {
             "octo",
             None,
             None,
-            &*provider("github_copilot"),
+            &*copilot,
             vec![quota.clone()],
             false,
             false,
         );
-        let ansi = render_quotas(
-            "octo",
-            None,
-            None,
-            &*provider("github_copilot"),
-            vec![quota],
-            false,
-            true,
-        );
+        let ansi = render_quotas("octo", None, None, &*copilot, vec![quota], false, true);
         let mut stripped = ansi;
         for code in ["\x1b[0m", "\x1b[2m", "\x1b[32m", "\x1b[33m", "\x1b[37m"] {
             stripped = stripped.replace(code, "");
@@ -556,22 +557,79 @@ mod tests {
             .extra
             .insert("message".into(), json!("billing unavailable"));
         assert_eq!(
-            render_quotas(
-                "octo",
-                None,
-                None,
-                &*provider("github_copilot"),
-                vec![error],
-                false,
-                false
-            ),
+            render_quotas("octo", None, None, &*copilot, vec![error], false, false),
             "📧 GitHub Copilot: octo\nacme                   ⚠️ billing unavailable\n"
         );
     }
 
+    #[test]
+    fn query_filter_matches_every_query_case_insensitively() {
+        let quotas = vec![
+            Quota {
+                name: "gpt-5-codex".into(),
+                display_name: "Five hour".into(),
+                ..Default::default()
+            },
+            Quota {
+                name: "gpt-5-codex-weekly".into(),
+                display_name: "Weekly".into(),
+                ..Default::default()
+            },
+        ];
+        let names = |queries: &[&str]| {
+            let queries: Vec<String> = queries.iter().map(|q| (*q).into()).collect();
+            query_filter(quotas.clone(), &queries)
+                .into_iter()
+                .map(|q| q.display_name)
+                .collect::<Vec<_>>()
+        };
+        assert_eq!(names(&[]), ["Five hour", "Weekly"]);
+        assert_eq!(names(&["CODEX"]), ["Five hour", "Weekly"]);
+        assert_eq!(names(&["codex", "hour"]), ["Five hour"]);
+        assert!(names(&["weekly", "hour"]).is_empty());
+    }
+
+    #[test]
+    fn reset_parses_rfc3339_and_epoch_seconds_or_millis() {
+        let expected = Utc.with_ymd_and_hms(2025, 2, 19, 21, 19, 59).unwrap();
+        assert_eq!(parse_reset("2025-02-19T21:19:59Z"), Some(expected));
+        assert_eq!(parse_reset("2025-02-19T22:19:59+01:00"), Some(expected));
+        assert_eq!(parse_reset("1739999999"), Some(expected));
+        assert_eq!(parse_reset("1739999999000"), Some(expected));
+        assert_eq!(parse_reset("2025-02-19"), None);
+        assert_eq!(parse_reset("Monthly"), None);
+    }
+
+    #[test]
+    fn bar_color_bands_flip_between_used_and_remaining() {
+        for (p, remaining, used) in [
+            (0.0, "red", "green"),
+            (20.0, "red", "green"),
+            (20.1, "yellow", "yellow"),
+            (50.0, "yellow", "yellow"),
+            (80.0, "green", "red"),
+        ] {
+            assert_eq!(bar_color(p, false), remaining, "{p}");
+            assert_eq!(bar_color(p, true), used, "{p}");
+        }
+    }
+
+    #[test]
+    fn headers_and_separator_match_their_styled_forms() {
+        assert_eq!(
+            main_header(true),
+            format!("\n{}\n", styled("Quota Status", "1;34", true))
+        );
+        assert_eq!(main_header(false), "\nQuota Status\n");
+        assert_eq!(separator(true), format!("{}\n", "━".repeat(50)));
+    }
+
     #[test]
     fn countdown_uses_compact_units_without_absolute_time() {
         assert_eq!(format_countdown(19 * 60), " (19m)");
+        assert_eq!(format_countdown(59), " (0m)");
+        assert_eq!(format_countdown(2 * 86_400 + 5 * 60), " (2d 5m)");
+        assert_eq!(format_countdown(0), "");
         assert_eq!(
             format_countdown(5 * 86_400 + 19 * 3_600 + 43 * 60),
             " (5d 19h 43m)"
@@ -581,6 +639,10 @@ mod tests {
     #[test]
     fn normal_bar_fraction_and_standard_row_have_stable_spacing() {
         assert_eq!(bar(25.5, 30, false), "███████▋                      ");
+        assert_eq!(bar(100.0, 10, false), "██████████");
+        assert_eq!(bar(0.0, 5, true), "     ");
+        assert_eq!(bar(55.0, 20, false), "███████████         ");
+        assert_eq!(bar(25.5, 30, true), "███████                       ");
         let quota = Quota {
             display_name: "Five hour".into(),
             used_pct: Some(25.5),
@@ -603,6 +665,7 @@ mod tests {
 
     #[test]
     fn normal_color_and_plain_goldens() {
+        let openai = provider("openai");
         std::env::set_var("COLUMNS", "80");
         let quotas = vec![
             Quota {
@@ -620,7 +683,7 @@ mod tests {
             "me@example.com",
             Some("work"),
             Some("team"),
-            &*provider("openai"),
+            &*openai,
             quotas.clone(),
             false,
             false,
@@ -629,7 +692,7 @@ mod tests {
             "me@example.com",
             Some("work"),
             Some("team"),
-            &*provider("openai"),
+            &*openai,
             quotas,
             false,
             true,
@@ -686,6 +749,7 @@ mod tests {
 
     #[test]
     fn text_only_and_ai_credit_rows_keep_labels_in_both_layouts() {
+        let copilot = provider("github_copilot");
         let mut credits = Quota {
             display_name: "AI Credits".into(),
             used: Some(231.3),
@@ -709,7 +773,7 @@ mod tests {
             "octo",
             Some(""),
             Some(""),
-            &*provider("github_copilot"),
+            &*copilot,
             vec![credits.clone(), balance.clone()],
             false,
             false,
@@ -723,7 +787,7 @@ mod tests {
             "octo",
             Some(""),
             Some(""),
-            &*provider("github_copilot"),
+            &*copilot,
             vec![credits, balance],
             true,
             false,
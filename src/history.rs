@@ -54,7 +54,8 @@ impl HistoryManager {
         if value.is_empty() {
             return None;
         }
-        DateTime::parse_from_rfc3339(&value.replace('Z', "+00:00"))
+        // RFC 3339 already accepts a `Z` offset; parse the input as given.
+        DateTime::parse_from_rfc3339(value)
             .ok()
             .map(|x| x.with_timezone(&Utc))
             .or_else(|| {
@@ -747,6 +748,31 @@ mod tests {
         }
     }
 
+    #[test]
+    fn parse_datetime_accepts_iso_naive_date_and_relative_forms() {
+        let expected = Utc.with_ymd_and_hms(2024, 1, 15, 10, 30, 0).unwrap();
+        for value in [
+            "2024-01-15T10:30:00Z",
+            "2024-01-15T10:30:00+00:00",
+            "2024-01-15T12:30:00+02:00",
+            "2024-01-15T10:30:00",
+            "2024-01-15 10:30:00",
+        ] {
+            assert_eq!(HistoryManager::parse_datetime(value), Some(expected));
+        }
+        assert_eq!(
+            HistoryManager::parse_datetime("2024-01-15"),
+            Some(Utc.with_ymd_and_hms(2024, 1, 15, 0, 0, 0).unwrap())
+        );
+        for (value, ago) in [("2d", Duration::days(2)), ("6h", Duration::hours(6))] {
+            let parsed = HistoryManager::parse_datetime(value).unwrap();
+            assert!((Utc::now() - ago - parsed).num_seconds().abs() < 1);
+        }
+        for value in ["", "d", "2w", "-2d", "yesterday"] {
+            assert_eq!(HistoryManager::parse_datetime(value), None);
+        }
+    }
+
     #[test]
     fn history_tables_keep_columns_fixed_and_include_health() {
         let rows = vec![
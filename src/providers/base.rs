@@ -154,23 +154,32 @@ pub fn sanitize_diagnostic(value: &str) -> String {
     sanitized.join(" ")
 }
 
+/// Epoch magnitudes above this are milliseconds rather than seconds.
+const EPOCH_MILLIS_THRESHOLD: f64 = 10_000_000_000.;
+
+/// UTC instant for epoch seconds or milliseconds, keeping fractional precision.
+/// Non-finite or out-of-range values yield `None`.
+pub fn epoch_datetime(mut epoch: f64) -> Option<DateTime<Utc>> {
+    if !epoch.is_finite() {
+        return None;
+    }
+    if epoch.abs() > EPOCH_MILLIS_THRESHOLD {
+        epoch /= 1000.;
+    }
+    let seconds = epoch.trunc() as i64;
+    let nanos = ((epoch - seconds as f64) * 1_000_000_000.)
+        .round()
+        .clamp(0., 999_999_999.) as u32;
+    Utc.timestamp_opt(seconds, nanos).single()
+}
+
 /// Canonical RFC3339 UTC representation for epoch seconds/milliseconds or RFC3339 input.
 pub fn normalize_reset(value: &Value) -> Option<String> {
     let epoch = value
         .as_f64()
         .or_else(|| value.as_str().and_then(|s| s.trim().parse::<f64>().ok()));
-    let parsed: DateTime<Utc> = if let Some(mut epoch) = epoch {
-        if !epoch.is_finite() {
-            return None;
-        }
-        if epoch.abs() > 10_000_000_000. {
-            epoch /= 1000.;
-        }
-        let seconds = epoch.trunc() as i64;
-        let nanos = ((epoch - seconds as f64) * 1_000_000_000.)
-            .round()
-            .clamp(0., 999_999_999.) as u32;
-        Utc.timestamp_opt(seconds, nanos).single()?
+    let parsed: DateTime<Utc> = if let Some(epoch) = epoch {
+        epoch_datetime(epoch)?
     } else {
         DateTime::parse_from_rfc3339(value.as_str()?)
             .ok()?
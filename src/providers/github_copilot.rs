@@ -1,11 +1,17 @@
 use super::base::*;
 use crate::model::{Account, Quota, Timing};
 use anyhow::Context;
-use chrono::{Datelike, Months, TimeZone, Utc};
+use chrono::{DateTime, Datelike, Months, TimeZone, Utc};
 use serde_json::Value;
 use std::collections::BTreeMap;
 use std::time::{Duration, Instant};
 
+/// Ceiling for `gh` subprocesses; a request deadline can only shorten it.
+const GH_TIMEOUT: Duration = Duration::from_secs(6);
+const INTERNAL_USER_URL: &str = "https://api.github.com/copilot_internal/user";
+const API_VERSION: &str = "2026-03-10";
+const INTERNAL_API_VERSION: &str = "2025-04-01";
+
 type BillingResult = (Option<(Value, &'static str, bool)>, Option<String>);
 
 fn number(value: &Value) -> Option<f64> {
@@ -172,7 +178,7 @@ impl GitHubCopilotProvider {
         let Ok(output) = p.run(
             "gh",
             &["auth", "status"],
-            x.remaining(Duration::from_secs(6)).unwrap_or_default(),
+            x.remaining(GH_TIMEOUT).unwrap_or_default(),
         ) else {
             return vec![];
         };
@@ -219,48 +225,33 @@ impl GitHubCopilotProvider {
         })
     }
     fn org_allowance(seats: Option<i64>, plan: Option<&str>) -> Option<f64> {
+        Self::org_allowance_at(seats, plan, Utc::now())
+    }
+    fn org_allowance_at(seats: Option<i64>, plan: Option<&str>, now: DateTime<Utc>) -> Option<f64> {
         let s = seats.filter(|x| *x > 0)? as f64;
         let p = plan?.to_lowercase();
-        let promo = Utc::now() >= Utc.with_ymd_and_hms(2026, 6, 1, 0, 0, 0).unwrap()
-            && Utc::now() < Utc.with_ymd_and_hms(2026, 9, 1, 0, 0, 0).unwrap();
-        Some(
-            s * if p.contains("enterprise") {
-                if promo {
-                    7000.
-                } else {
-                    3900.
-                }
-            } else if p.contains("business") {
-                if promo {
-                    3000.
-                } else {
-                    1900.
-                }
-            } else {
-                return None;
-            },
-        )
+        let (regular, promo) = if p.contains("enterprise") {
+            (3900., 7000.)
+        } else if p.contains("business") {
+            (1900., 3000.)
+        } else {
+            return None;
+        };
+        let in_promo = Utc.with_ymd_and_hms(2026, 6, 1, 0, 0, 0).unwrap() <= now
+            && now < Utc.with_ymd_and_hms(2026, 9, 1, 0, 0, 0).unwrap();
+        Some(s * if in_promo { promo } else { regular })
     }
     fn parse_internal_org(v: &Value, organization: &str) -> Option<Quota> {
-        let matches_org = v
-            .get("organization_login_list")
-            .and_then(Value::as_array)
-            .into_iter()
+        let organization = organization.trim();
+        let matches_org = ["organization_login_list", "organization_list"]
+            .iter()
+            .filter_map(|key| v.get(*key).and_then(Value::as_array))
             .flatten()
             .any(|org| {
                 org.as_str()
                     .or_else(|| org.get("login").and_then(Value::as_str))
-                    .is_some_and(|login| login.trim().eq_ignore_ascii_case(organization.trim()))
-            })
-            || v.get("organization_list")
-                .and_then(Value::as_array)
-                .into_iter()
-                .flatten()
-                .any(|org| {
-                    org.as_str()
-                        .or_else(|| org.get("login").and_then(Value::as_str))
-                        .is_some_and(|login| login.trim().eq_ignore_ascii_case(organization.trim()))
-                });
+                    .is_some_and(|login| login.trim().eq_ignore_ascii_case(organization))
+            });
         if !matches_org {
             return None;
         }
@@ -270,46 +261,48 @@ impl GitHubCopilotProvider {
         {
             return None;
         }
-        let entitlement = premium.get("entitlement").and_then(number)?;
-        if !entitlement.is_finite() || entitlement <= 0.0 {
-            return None;
-        }
+        // `number` only yields finite values, so no further checks are needed.
+        let entitlement = premium
+            .get("entitlement")
+            .and_then(number)
+            .filter(|n| *n > 0.)?;
         let remaining = premium
             .get("quota_remaining")
             .or_else(|| premium.get("remaining"))
             .and_then(number)
-            .filter(|n| n.is_finite())
             .or_else(|| {
                 premium
                     .get("percent_remaining")
                     .and_then(number)
-                    .filter(|n| n.is_finite())
                     .map(|p| entitlement * p.clamp(0., 100.) / 100.)
             });
         let used = premium
             .get("used")
             .and_then(number)
-            .filter(|n| n.is_finite())
             .or_else(|| remaining.map(|left| (entitlement - left).max(0.)))
             .or_else(|| premium.get("overage_count").and_then(number))?;
-        let remaining = remaining.unwrap_or_else(|| (entitlement - used).max(0.));
+        let remaining = remaining
+            .unwrap_or(entitlement - used)
+            .clamp(0., entitlement);
         let used = used.clamp(0., entitlement);
-        let mut q = quota(
-            &format!("GitHub Copilot Org ({organization})"),
-            organization,
-            "GitHub Copilot",
-        );
-        q.limit = Some(entitlement);
-        q.remaining = Some(remaining.clamp(0., entitlement));
-        q.used = Some(used);
         let used_pct = (used / entitlement * 100.0).clamp(0., 100.);
-        q.used_pct = Some(used_pct);
-        q.remaining_pct = Some(100.0 - used_pct);
-        q.reset_time = v
-            .get("quota_reset_date_utc")
-            .or_else(|| v.get("quota_reset_date"))
-            .and_then(normalize_reset)
-            .or_else(|| Some(Self::reset()));
+        let mut q = Quota {
+            limit: Some(entitlement),
+            remaining: Some(remaining),
+            used: Some(used),
+            used_pct: Some(used_pct),
+            remaining_pct: Some(100.0 - used_pct),
+            reset_time: v
+                .get("quota_reset_date_utc")
+                .or_else(|| v.get("quota_reset_date"))
+                .and_then(normalize_reset)
+                .or_else(|| Some(Self::reset())),
+            ..quota(
+                &format!("GitHub Copilot Org ({organization})"),
+                organization,
+                "GitHub Copilot",
+            )
+        };
         extra(&mut q, "billing_model", "ai_credits");
         extra(&mut q, "billing_source", "copilot_internal_user");
         if let Some(value) = v.get("token_based_billing") {
@@ -355,7 +348,7 @@ impl GitHubCopilotProvider {
         };
         let base = format!("https://api.github.com/{root}/settings/billing/usage");
         let (usage, mut empty, mut diagnostic) = (None, None, None);
-        for (url, source) in [
+        'urls: for (url, source) in [
             (base.clone(), "usage"),
             (format!("{base}/summary"), "summary"),
         ] {
@@ -376,6 +369,11 @@ impl GitHubCopilotProvider {
                         continue;
                     }
                 };
+                if let Some(limited) = Self::rate_limit_diagnostic(&r) {
+                    // Every remaining fallback would be refused as well.
+                    diagnostic = Some(limited);
+                    break 'urls;
+                }
                 if r.status != 200 {
                     diagnostic.get_or_insert_with(|| {
                         Self::billing_diagnostic(
@@ -398,6 +396,23 @@ impl GitHubCopilotProvider {
         }
         Ok((result, diagnostic))
     }
+    fn rate_limit_diagnostic(r: &HttpResponse) -> Option<String> {
+        let header = |name: &str| {
+            r.headers
+                .iter()
+                .find(|(k, _)| k.eq_ignore_ascii_case(name))
+                .map(|(_, v)| v.trim())
+        };
+        if r.status != 429 && !(r.status == 403 && header("x-ratelimit-remaining") == Some("0")) {
+            return None;
+        }
+        Some(
+            match header("x-ratelimit-reset").and_then(|v| normalize_reset(&Value::from(v))) {
+                Some(reset) => format!("GitHub billing rate limited until {reset}; retry later."),
+                None => "GitHub billing rate limited; retry later.".into(),
+            },
+        )
+    }
     fn billing_diagnostic(status: u16, detail: Option<&str>) -> String {
         let detail = detail
             .map(sanitize_diagnostic)
@@ -417,7 +432,7 @@ impl GitHubCopilotProvider {
             || vec!["auth", "token"],
             |u| vec!["auth", "token", "--user", u],
         );
-        let output = p.run("gh", &args, x.remaining(Duration::from_secs(6))?)?;
+        let output = p.run("gh", &args, x.remaining(GH_TIMEOUT)?)?;
         if !output.success {
             let diagnostic =
                 sanitize_diagnostic(output.stderr.lines().next().unwrap_or("unknown error"));
@@ -456,25 +471,20 @@ impl GitHubCopilotProvider {
         url: String,
         token: &str,
     ) -> anyhow::Result<HttpResponse> {
-        let internal = url == "https://api.github.com/copilot_internal/user";
-        let mut headers = if internal {
-            BTreeMap::from([
-                ("Authorization".into(), format!("token {token}")),
-                ("Content-Type".into(), "application/json".into()),
-            ])
+        // The internal endpoint predates the current REST API version and
+        // only accepts the legacy `token` scheme.
+        let (scheme, version) = if url == INTERNAL_USER_URL {
+            ("token", INTERNAL_API_VERSION)
         } else {
-            bearer(token)
+            ("Bearer", API_VERSION)
         };
-        headers.insert("Accept".into(), "application/vnd.github+json".into());
-        headers.insert(
-            "X-GitHub-Api-Version".into(),
-            if internal {
-                "2025-04-01".into()
-            } else {
-                "2026-03-10".into()
-            },
-        );
-        headers.insert("User-Agent".into(), "limitwatch".into());
+        let headers = BTreeMap::from([
+            ("Authorization".into(), format!("{scheme} {token}")),
+            ("Content-Type".into(), "application/json".into()),
+            ("Accept".into(), "application/vnd.github+json".into()),
+            ("X-GitHub-Api-Version".into(), version.into()),
+            ("User-Agent".into(), "limitwatch".into()),
+        ]);
         checked(
             c,
             x,
@@ -656,16 +666,27 @@ impl Provider for GitHubCopilotProvider {
                 .map(str::trim)
                 .filter(|org| !org.is_empty());
             let mut out = vec![];
+            let identity = self.a.identity();
             // This endpoint is independent of billing and is intentionally fetched once.
-            let internal = Self::traced_request(
-                c,
-                x,
-                "https://api.github.com/copilot_internal/user".into(),
-                token,
-                &mut self.t,
-            )
-            .ok()
-            .filter(|r| r.status == 200);
+            // Personal billing needs it only for the allowance, so both run together;
+            // an organization's billing is fetched only when the snapshot is missing.
+            let (internal, personal) = std::thread::scope(|s| {
+                let personal = organization.is_none().then(|| {
+                    s.spawn(|| {
+                        let mut traces = vec![];
+                        let usage = Self::billing(c, x, token, identity, false, &mut traces);
+                        (usage, traces)
+                    })
+                });
+                let internal =
+                    Self::traced_request(c, x, INTERNAL_USER_URL.into(), token, &mut self.t);
+                let personal = personal.map(|h| {
+                    h.join()
+                        .unwrap_or_else(|panic| std::panic::resume_unwind(panic))
+                });
+                (internal, personal)
+            });
+            let internal = internal.ok().filter(|r| r.status == 200);
             let internal_org = organization.and_then(|org| {
                 internal
                     .as_ref()
@@ -683,9 +704,9 @@ impl Provider for GitHubCopilotProvider {
                     extra,
                 });
             }
-            if organization.is_none() {
-                let (personal_usage, _) =
-                    Self::billing(c, x, token, self.a.identity(), false, &mut self.t)?;
+            if let Some((usage, traces)) = personal {
+                self.t.extend(traces);
+                let (personal_usage, _) = usage?;
                 if let Some((body, source, filtered)) = personal_usage {
                     let mut q = Self::parse_billing(&body, None).unwrap_or_else(|| {
                         let mut q = quota("GitHub Copilot Personal", "Personal", "GitHub Copilot");
@@ -700,10 +721,12 @@ impl Provider for GitHubCopilotProvider {
                             &Value::Object(self.a.extra.clone().into_iter().collect()),
                         )))
                     {
+                        let used = q.used.unwrap_or(0.);
+                        let used_pct = used / limit * 100.;
                         q.limit = Some(limit);
-                        q.remaining = Some(limit - q.used.unwrap_or(0.));
-                        q.used_pct = Some(q.used.unwrap_or(0.) / limit * 100.);
-                        q.remaining_pct = Some(100. - q.used_pct.unwrap());
+                        q.remaining = Some(limit - used);
+                        q.used_pct = Some(used_pct);
+                        q.remaining_pct = Some(100. - used_pct);
                     }
                     q.reset_time = Some(Self::reset());
                     extra(&mut q, "billing_source", source);
@@ -812,20 +835,41 @@ mod tests {
     use serde_json::json;
     use std::sync::Mutex;
 
+    /// Routes on the exact endpoint path; any other endpoint answers with an
+    /// empty list.
     struct Http(Mutex<Vec<HttpRequest>>);
     impl HttpClient for Http {
         fn execute(&self, request: HttpRequest) -> Result<HttpResponse> {
-            let body = if request.url == "https://api.github.com/user" {
-                json!({"login":"work"})
-            } else {
-                json!([])
+            let path = request.url.split('?').next().unwrap_or_default();
+            let body = match path {
+                "https://api.github.com/user" => json!({"login":"work"}),
+                _ => json!([]),
             };
             self.0.lock().unwrap().push(request);
-            Ok(HttpResponse {
-                status: 200,
-                body,
-                headers: Default::default(),
-            })
+            Ok(response(200, body))
+        }
+    }
+
+    fn response(status: u16, body: Value) -> HttpResponse {
+        HttpResponse {
+            status,
+            body,
+            headers: BTreeMap::new(),
+        }
+    }
+
+    /// For paths that must never shell out to `gh`.
+    struct NoGh;
+    impl ProcessRunner for NoGh {
+        fn run(&self, _: &str, _: &[&str], _: Duration) -> Result<ProcessOutput> {
+            unreachable!()
+        }
+    }
+    /// Answers every `gh` invocation with the same canned output.
+    struct Gh(ProcessOutput);
+    impl ProcessRunner for Gh {
+        fn run(&self, _: &str, _: &[&str], _: Duration) -> Result<ProcessOutput> {
+            Ok(self.0.clone())
         }
     }
 
@@ -881,19 +925,95 @@ mod tests {
     }
 
     #[test]
-    fn login_persists_selected_user_and_organization() {
-        struct Proc;
-        impl ProcessRunner for Proc {
-            fn run(&self, _: &str, _: &[&str], _: Duration) -> Result<ProcessOutput> {
-                unreachable!()
+    fn personal_billing_overlaps_the_internal_user_request() {
+        /// The internal endpoint answers only once a billing request has arrived.
+        struct Overlap(
+            Mutex<std::sync::mpsc::Sender<()>>,
+            Mutex<std::sync::mpsc::Receiver<()>>,
+        );
+        impl HttpClient for Overlap {
+            fn execute(&self, request: HttpRequest) -> Result<HttpResponse> {
+                let body = if request.url == INTERNAL_USER_URL {
+                    self.1
+                        .lock()
+                        .unwrap()
+                        .recv_timeout(Duration::from_secs(5))?;
+                    json!({"copilot_plan":"pro"})
+                } else {
+                    let _ = self.0.lock().unwrap().send(());
+                    json!({"usageItems":[]})
+                };
+                Ok(response(200, body))
             }
         }
+        let (tx, rx) = std::sync::mpsc::channel();
+        let http = Overlap(Mutex::new(tx), Mutex::new(rx));
+        let mut account = Account {
+            provider_type: "github_copilot".into(),
+            email: "octo".into(),
+            ..Default::default()
+        };
+        account.extra.insert("githubToken".into(), json!("secret"));
+        let mut provider = GitHubCopilotProvider::new(account);
+        let quotas =
+            futures::executor::block_on(provider.fetch(&http, &NoGh, &RequestContext::default()))
+                .unwrap();
+        assert_eq!(quotas[0].display_name, "Personal");
+        assert_eq!(quotas[0].limit, Some(1500.));
+        let traces = provider.timings();
+        assert_eq!(traces[0].extra["path"], "/copilot_internal/user");
+        assert_eq!(traces.len(), 5);
+    }
+
+    #[test]
+    fn billing_stops_probing_once_the_rate_limit_is_exhausted() {
+        struct Limited(Mutex<usize>, u16, &'static str);
+        impl HttpClient for Limited {
+            fn execute(&self, _: HttpRequest) -> Result<HttpResponse> {
+                *self.0.lock().unwrap() += 1;
+                Ok(HttpResponse {
+                    headers: BTreeMap::from([
+                        ("x-ratelimit-remaining".into(), self.2.into()),
+                        ("x-ratelimit-reset".into(), "1700000000".into()),
+                    ]),
+                    ..response(self.1, json!({"message":"API rate limit exceeded"}))
+                })
+            }
+        }
+        let ctx = RequestContext::default();
+        for (status, remaining, requests, message) in [
+            (
+                403,
+                "0",
+                1,
+                "GitHub billing rate limited until 2023-11-14T22:13:20Z; retry later.",
+            ),
+            (
+                429,
+                "12",
+                1,
+                "GitHub billing rate limited until 2023-11-14T22:13:20Z; retry later.",
+            ),
+            (403, "12", 4, "GitHub billing unavailable (HTTP 403)"),
+        ] {
+            let http = Limited(Mutex::new(0), status, remaining);
+            let (usage, diagnostic) =
+                GitHubCopilotProvider::billing(&http, &ctx, "secret", "acme", true, &mut vec![])
+                    .unwrap();
+            assert!(usage.is_none());
+            assert_eq!(*http.0.lock().unwrap(), requests);
+            assert!(diagnostic.unwrap().starts_with(message));
+        }
+    }
+
+    #[test]
+    fn login_persists_selected_user_and_organization() {
         let http = Http(Mutex::new(vec![]));
         let mut provider = GitHubCopilotProvider::new(Account::default());
         let account = futures::executor::block_on(provider.login(
             json!({"githubToken":"secret","github_account":"work","organization":"acme"}),
             &http,
-            &Proc,
+            &NoGh,
             &RequestContext::default(),
         ))
         .unwrap();
@@ -904,37 +1024,108 @@ mod tests {
 
     #[test]
     fn gh_token_reports_failure_and_empty_output_deterministically() {
-        struct Proc(ProcessOutput);
+        let ctx = RequestContext::default();
+        for (success, stdout, stderr, expected) in [
+            (
+                false,
+                "",
+                "SSO required\nsecret detail",
+                Err("`gh auth token` failed: SSO required"),
+            ),
+            (true, "", "warning only", Ok(None)),
+            (true, " \n", "", Ok(None)),
+            (true, "gho_token\n", "", Ok(Some("gho_token"))),
+        ] {
+            let gh = Gh(ProcessOutput {
+                success,
+                stdout: stdout.into(),
+                stderr: stderr.into(),
+            });
+            let result = GitHubCopilotProvider::gh_token(&gh, Some("work"), &ctx);
+            match expected {
+                Ok(token) => assert_eq!(result.unwrap().as_deref(), token),
+                Err(message) => assert_eq!(result.unwrap_err().to_string(), message),
+            }
+        }
+    }
+
+    #[test]
+    fn gh_commands_are_bounded_by_the_request_deadline() {
+        struct Proc(Mutex<Vec<Duration>>);
         impl ProcessRunner for Proc {
-            fn run(&self, _: &str, _: &[&str], _: Duration) -> Result<ProcessOutput> {
-                Ok(self.0.clone())
+            fn run(&self, _: &str, _: &[&str], timeout: Duration) -> Result<ProcessOutput> {
+                self.0.lock().unwrap().push(timeout);
+                Ok(ProcessOutput {
+                    success: true,
+                    stdout: "token".into(),
+                    ..Default::default()
+                })
             }
         }
-        let ctx = RequestContext::default();
-        let error = GitHubCopilotProvider::gh_token(
-            &Proc(ProcessOutput {
-                success: false,
-                stdout: String::new(),
-                stderr: "SSO required\nsecret detail".into(),
-            }),
-            Some("work"),
-            &ctx,
-        )
-        .unwrap_err();
-        assert_eq!(error.to_string(), "`gh auth token` failed: SSO required");
+        let proc = Proc(Mutex::new(vec![]));
+        GitHubCopilotProvider::gh_token(&proc, None, &RequestContext::default()).unwrap();
+        let ctx = RequestContext {
+            deadline: Some(Instant::now() + Duration::from_millis(20)),
+            ..Default::default()
+        };
+        GitHubCopilotProvider::gh_token(&proc, None, &ctx).unwrap();
+        GitHubCopilotProvider::discover_gh_accounts(&proc, &ctx);
+        let timeouts = proc.0.lock().unwrap();
+        assert_eq!(timeouts[0], GH_TIMEOUT);
+        assert!(timeouts[1..]
+            .iter()
+            .all(|t| *t <= Duration::from_millis(20)));
+    }
+
+    #[test]
+    fn plan_allowance_maps_every_known_plan_name() {
+        for (body, allowance) in [
+            (json!({"copilot_plan":"pro"}), Some(1500.)),
+            (json!({"plan":"individual"}), Some(1500.)),
+            (json!({"plan_type":"Pro+"}), Some(7000.)),
+            (json!({"sku":"Copilot Pro Plus"}), Some(7000.)),
+            (json!({"subscription":"max"}), Some(20000.)),
+            (json!({"copilot_plan":"business"}), None),
+            (json!({}), None),
+        ] {
+            assert_eq!(
+                GitHubCopilotProvider::plan_allowance(Some(&body)),
+                allowance,
+                "{body}"
+            );
+        }
+        assert_eq!(GitHubCopilotProvider::plan_allowance(None), None);
+    }
+
+    #[test]
+    fn org_allowance_scales_per_seat_allowance_by_plan() {
         assert_eq!(
-            GitHubCopilotProvider::gh_token(
-                &Proc(ProcessOutput {
-                    success: true,
-                    stdout: String::new(),
-                    stderr: "warning only".into()
-                }),
-                None,
-                &ctx
-            )
-            .unwrap(),
+            GitHubCopilotProvider::org_allowance(Some(0), Some("business")),
+            None
+        );
+        assert_eq!(
+            GitHubCopilotProvider::org_allowance(Some(2), Some("free")),
             None
         );
+        assert_eq!(GitHubCopilotProvider::org_allowance(Some(2), None), None);
+        let before = Utc.with_ymd_and_hms(2026, 5, 31, 23, 59, 59).unwrap();
+        let start = Utc.with_ymd_and_hms(2026, 6, 1, 0, 0, 0).unwrap();
+        let end = Utc.with_ymd_and_hms(2026, 9, 1, 0, 0, 0).unwrap();
+        for (now, business, enterprise) in [
+            (before, 3800., 7800.),
+            (start, 6000., 14000.),
+            (end - chrono::Duration::seconds(1), 6000., 14000.),
+            (end, 3800., 7800.),
+        ] {
+            assert_eq!(
+                GitHubCopilotProvider::org_allowance_at(Some(2), Some("Business"), now),
+                Some(business)
+            );
+            assert_eq!(
+                GitHubCopilotProvider::org_allowance_at(Some(2), Some("enterprise"), now),
+                Some(enterprise)
+            );
+        }
     }
 
     #[test]
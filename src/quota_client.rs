@@ -123,3 +123,47 @@ impl QuotaClient {
         self.provider.account()
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::io::{BufRead, BufReader, Write};
+    use std::net::TcpListener;
+    use std::time::Duration;
+
+    #[test]
+    fn shared_client_advertises_gzip() {
+        let listener = TcpListener::bind("127.0.0.1:0").unwrap();
+        let url = format!("http://{}/", listener.local_addr().unwrap());
+        let server = std::thread::spawn(move || {
+            let (mut stream, _) = listener.accept().unwrap();
+            let mut headers = vec![];
+            for line in BufReader::new(stream.try_clone().unwrap()).lines() {
+                let line = line.unwrap();
+                if line.is_empty() {
+                    break;
+                }
+                headers.push(line.to_ascii_lowercase());
+            }
+            stream
+                .write_all(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\n{}")
+                .unwrap();
+            headers
+        });
+        let response = SharedHttp::new()
+            .unwrap()
+            .execute(HttpRequest {
+                method: "GET",
+                url,
+                headers: Default::default(),
+                body: None,
+                timeout: Duration::from_secs(5),
+            })
+            .unwrap();
+        assert_eq!(response.status, 200);
+        let headers = server.join().unwrap();
+        assert!(headers
+            .iter()
+            .any(|h| h.starts_with("accept-encoding:") && h.contains("gzip")));
+    }
+}
@@ -162,3 +162,20 @@ fn contract_fixture_documents_google_omission() {
         .unwrap()
         .contains(&json!("google")));
 }
+
+#[cfg(unix)]
+#[test]
+fn unchanged_accounts_are_not_rewritten() {
+    use std::os::unix::fs::MetadataExt;
+    let dir = tempfile::tempdir().unwrap();
+    let path = dir.path().join("accounts.json");
+    let inode = || fs::metadata(&path).unwrap().ino();
+    let mut auth = AuthManager::new(&path);
+    auth.login(account("openai", "a@example.com")).unwrap();
+    let written = inode();
+    auth.save_accounts().unwrap();
+    AuthManager::new(&path).save_accounts().unwrap();
+    assert_eq!(inode(), written);
+    auth.login(account("openai", "b@example.com")).unwrap();
+    assert_ne!(inode(), written);
+}
@@ -1,13 +1,25 @@
-use chrono::{TimeZone, Utc};
+use chrono::{DateTime, TimeZone, Utc};
 use limitwatch::export::{ExportFilter, Exporter};
 use limitwatch::history::HistoryManager;
 use limitwatch::model::Quota;
 use limitwatch::storage::Storage;
+use tempfile::TempDir;
 
-#[test]
-fn replacement_queries_stats_purge_and_exports() {
+/// Fixed snapshot time so exports and purges do not depend on the clock.
+fn recorded_at() -> DateTime<Utc> {
+    Utc.with_ymd_and_hms(2024, 1, 15, 10, 30, 0).unwrap()
+}
+
+/// Each test gets its own database; the directory must outlive the manager.
+fn manager() -> (TempDir, HistoryManager) {
     let dir = tempfile::tempdir().unwrap();
     let mgr = HistoryManager::new(Some(dir.path().join("history.db"))).unwrap();
+    (dir, mgr)
+}
+
+#[test]
+fn replacement_queries_stats_purge_and_exports() {
+    let (_dir, mgr) = manager();
     let mut q = Quota {
         name: "quota".into(),
         display_name: "Quota".into(),
@@ -16,7 +28,7 @@ fn replacement_queries_stats_purge_and_exports() {
         limit: Some(100.0),
         ..Default::default()
     };
-    let t = Utc.with_ymd_and_hms(2024, 1, 15, 10, 30, 0).unwrap();
+    let t = recorded_at();
     mgr.record_quotas("a@example.com", "openai", &[q.clone()], Some(t))
         .unwrap();
     q.remaining_pct = Some(70.0);
@@ -65,7 +77,7 @@ fn google_records_are_stored_but_ignored_by_history_views() {
                 "google@example.com",
                 "google",
                 &[quota],
-                Some(Utc.with_ymd_and_hms(2024, 1, 15, 10, 30, 0).unwrap()),
+                Some(recorded_at()),
             )
             .unwrap(),
         1
@@ -101,8 +113,7 @@ fn google_records_are_stored_but_ignored_by_history_views() {
 
 #[test]
 fn skips_error_and_filters() {
-    let dir = tempfile::tempdir().unwrap();
-    let mgr = HistoryManager::new(Some(dir.path().join("h.db"))).unwrap();
+    let (_dir, mgr) = manager();
     let mut q = Quota {
         name: "bad".into(),
         ..Default::default()
@@ -1,6 +1,6 @@
 use anyhow::Result;
 use limitwatch::{
-    model::Account,
+    model::{Account, Quota},
     providers::{self, base::*},
 };
 use serde_json::{json, Value};
@@ -9,25 +9,100 @@ use std::{
     sync::Mutex,
     time::{Duration, Instant},
 };
+/// Parses `tests/fixtures/github_copilot/<name>.json`, embedded at build time.
+macro_rules! github_fixture {
+    ($name:literal) => {
+        serde_json::from_str::<Value>(include_str!(concat!(
+            "fixtures/github_copilot/",
+            $name,
+            ".json"
+        )))
+        .unwrap()
+    };
+}
 struct Http {
     responses: Mutex<Vec<HttpResponse>>,
     requests: Mutex<Vec<HttpRequest>>,
 }
+impl Http {
+    fn new(responses: Vec<HttpResponse>) -> Self {
+        Self {
+            responses: Mutex::new(responses),
+            requests: Mutex::new(vec![]),
+        }
+    }
+}
 impl HttpClient for Http {
     fn execute(&self, r: HttpRequest) -> Result<HttpResponse> {
         self.requests.lock().unwrap().push(r);
         Ok(self.responses.lock().unwrap().remove(0))
     }
 }
+/// Answers each request from the first route whose pattern occurs in its
+/// URL, falling back to a GitHub-style 404.
+struct Routes {
+    routes: Vec<(&'static str, HttpResponse)>,
+    requests: Mutex<Vec<HttpRequest>>,
+}
+impl HttpClient for Routes {
+    fn execute(&self, r: HttpRequest) -> Result<HttpResponse> {
+        let response = self
+            .routes
+            .iter()
+            .find(|(pattern, _)| r.url.contains(pattern))
+            .map_or_else(not_found, |(_, response)| response.clone());
+        self.requests.lock().unwrap().push(r);
+        Ok(response)
+    }
+}
+/// The endpoints an organization fetch can touch: the internal-user
+/// snapshot, billing usage and a two-seat business plan.
+fn org_routes(internal: HttpResponse, usage: HttpResponse) -> Routes {
+    Routes {
+        routes: vec![
+            ("/copilot_internal/user", internal),
+            ("/settings/billing/usage", usage),
+            ("/copilot/billing", business_seats()),
+        ],
+        requests: Mutex::new(vec![]),
+    }
+}
+fn response(status: u16, body: Value) -> HttpResponse {
+    HttpResponse {
+        status,
+        body,
+        headers: Default::default(),
+    }
+}
+fn not_found() -> HttpResponse {
+    response(404, json!({"message":"Not Found"}))
+}
+fn empty_usage() -> HttpResponse {
+    response(200, json!({"usageItems":[]}))
+}
+/// Two AI credits used this month.
+fn ai_credits_usage() -> HttpResponse {
+    response(200, github_fixture!("ai_credits_usage"))
+}
+/// A two-seat Copilot Business organization.
+fn business_seats() -> HttpResponse {
+    response(200, github_fixture!("business_seats"))
+}
+/// Behaves like a machine without `gh`; tests that need it bring their own.
 struct Proc;
 impl ProcessRunner for Proc {
-    fn run(&self, _: &str, _: &[&str], _: Duration) -> Result<ProcessOutput> {
-        Ok(ProcessOutput {
-            success: true,
-            ..Default::default()
-        })
+    fn run(&self, command: &str, _: &[&str], _: Duration) -> Result<ProcessOutput> {
+        Err(std::io::Error::new(
+            std::io::ErrorKind::NotFound,
+            format!("{command} not installed"),
+        )
+        .into())
     }
 }
+/// Runs a fetch against `http` with the default process double and context.
+fn fetch(provider: &mut dyn Provider, http: &dyn HttpClient) -> Result<Vec<Quota>> {
+    futures::executor::block_on(provider.fetch(http, &Proc, &RequestContext::default()))
+}
 fn account(kind: &str) -> Account {
     Account {
         provider_type: kind.into(),
@@ -37,6 +112,30 @@ fn account(kind: &str) -> Account {
         ..Default::default()
     }
 }
+/// A saved GitHub Copilot account with a stored token and organization.
+fn github_account(email: &str, token: &str, org: &str) -> Account {
+    let mut saved = account("github_copilot");
+    saved.email = email.into();
+    saved.extra.insert("githubToken".into(), json!(token));
+    saved.extra.insert("organization".into(), json!(org));
+    saved
+}
+fn github_provider(email: &str, token: &str, org: &str) -> Box<dyn Provider> {
+    providers::create(github_account(email, token, org)).unwrap()
+}
+fn assert_close(actual: Option<f64>, expected: f64) {
+    let actual = actual.expect("missing percentage");
+    assert!(
+        (actual - expected).abs() < f64::EPSILON,
+        "{actual} != {expected}"
+    );
+}
+fn assert_github_headers(request: &HttpRequest, token: &str) {
+    assert_eq!(request.headers["Authorization"], format!("Bearer {token}"));
+    assert_eq!(request.headers["Accept"], "application/vnd.github+json");
+    assert_eq!(request.headers["X-GitHub-Api-Version"], "2026-03-10");
+    assert_eq!(request.headers["User-Agent"], "limitwatch");
+}
 #[test]
 fn every_provider_has_stable_metadata() {
     for kind in ["github_copilot", "openai", "openrouter"] {
@@ -64,14 +163,7 @@ fn request_context_bounds_and_cancels() {
 
 #[test]
 fn checked_uses_remaining_absolute_deadline_for_each_request() {
-    let http = Http {
-        responses: Mutex::new(vec![HttpResponse {
-            status: 200,
-            body: Value::Null,
-            headers: Default::default(),
-        }]),
-        requests: Mutex::new(vec![]),
-    };
+    let http = Http::new(vec![response(200, Value::Null)]);
     let ctx = RequestContext {
         deadline: Some(Instant::now() + Duration::from_millis(20)),
         ..Default::default()
@@ -95,25 +187,9 @@ fn checked_uses_remaining_absolute_deadline_for_each_request() {
 #[test]
 fn provider_errors_do_not_expose_credentials() {
     let secret = "SECRET_KEY";
-    let http = Http {
-        responses: Mutex::new(vec![
-            HttpResponse {
-                status: 401,
-                body: Value::Null,
-                headers: Default::default(),
-            },
-            HttpResponse {
-                status: 401,
-                body: Value::Null,
-                headers: Default::default(),
-            },
-        ]),
-        requests: Mutex::new(vec![]),
-    };
+    let http = Http::new(vec![response(401, Value::Null), response(401, Value::Null)]);
     let mut p = providers::create(account("openrouter")).unwrap();
-    let error = futures::executor::block_on(p.fetch(&http, &Proc, &RequestContext::default()))
-        .unwrap_err()
-        .to_string();
+    let error = fetch(p.as_mut(), &http).unwrap_err().to_string();
     assert!(!error.contains(secret));
     assert!(!error.contains("Authorization"));
     assert_eq!(
@@ -134,14 +210,10 @@ fn parsers_accept_representative_payloads() {
 
 #[test]
 fn openrouter_redacted_key_labels_require_a_safe_friendly_name() {
-    let http = Http {
-        responses: Mutex::new(vec![HttpResponse {
-            status: 200,
-            body: json!({"data":{"label":"sk-or-v1-abc...xyz"}}),
-            headers: Default::default(),
-        }]),
-        requests: Mutex::new(vec![]),
-    };
+    let http = Http::new(vec![response(
+        200,
+        json!({"data":{"label":"sk-or-v1-abc...xyz"}}),
+    )]);
     let mut provider = providers::create(Account {
         provider_type: "openrouter".into(),
         email: "pending".into(),
@@ -200,11 +272,7 @@ fn reset_and_failure_contract_fixture_matches() {
     }
     for c in f["failures"].as_array().unwrap() {
         let error = require_success(
-            HttpResponse {
-                status: c["status"].as_u64().unwrap() as u16,
-                body: Value::Null,
-                headers: Default::default(),
-            },
+            response(c["status"].as_u64().unwrap() as u16, Value::Null),
             "fetch",
         )
         .unwrap_err();
@@ -254,21 +322,10 @@ fn openai_local_credentials_and_extended_usage_contract() {
         .to_string(),
     )
     .unwrap();
-    let http = Http {
-        responses: Mutex::new(vec![
-            HttpResponse {
-                status: 200,
-                body: json!({"plan_type":"pro"}),
-                headers: Default::default(),
-            },
-            HttpResponse {
-                status: 401,
-                body: Value::Null,
-                headers: Default::default(),
-            },
-        ]),
-        requests: Mutex::new(vec![]),
-    };
+    let http = Http::new(vec![
+        response(200, json!({"plan_type":"pro"})),
+        response(401, Value::Null),
+    ]);
     let mut provider = OpenAiProvider::new(account("openai"));
     let logged_in = futures::executor::block_on(provider.login(
         json!({"authFile":path.to_string_lossy()}),
@@ -293,25 +350,15 @@ fn openai_local_credentials_and_extended_usage_contract() {
 
 #[test]
 fn openrouter_key_fallback_marks_unlimited_keys_as_spend_only() {
-    let http = Http {
-        responses: Mutex::new(vec![
-            HttpResponse {
-                status: 403,
-                body: Value::Null,
-                headers: Default::default(),
-            },
-            HttpResponse {
-                status: 200,
-                body: json!({"data":{"label":"unlimited","usage":314.0 / 100.0,"limit":null}}),
-                headers: Default::default(),
-            },
-        ]),
-        requests: Mutex::new(vec![]),
-    };
+    let http = Http::new(vec![
+        response(403, Value::Null),
+        response(
+            200,
+            json!({"data":{"label":"unlimited","usage":314.0 / 100.0,"limit":null}}),
+        ),
+    ]);
     let mut provider = providers::create(account("openrouter")).unwrap();
-    let quotas =
-        futures::executor::block_on(provider.fetch(&http, &Proc, &RequestContext::default()))
-            .unwrap();
+    let quotas = fetch(provider.as_mut(), &http).unwrap();
     assert_eq!(quotas[0].display_name, "unlimited: $3.14 spent");
     assert_eq!(quotas[0].remaining_pct, Some(100.));
     assert_eq!(quotas[0].limit, Some(0.));
@@ -334,14 +381,7 @@ fn github_selected_identity_and_explicit_org_survive_optional_403s() {
             })
         }
     }
-    let http = Http {
-        responses: Mutex::new(vec![HttpResponse {
-            status: 200,
-            body: json!({"login":"Selected-User"}),
-            headers: Default::default(),
-        }]),
-        requests: Mutex::new(vec![]),
-    };
+    let http = Http::new(vec![response(200, json!({"login":"Selected-User"}))]);
     let gh = Gh(Mutex::new(vec![]));
     let mut provider = providers::create(account("github_copilot")).unwrap();
     let logged_in = futures::executor::block_on(provider.login(
@@ -358,10 +398,7 @@ fn github_selected_identity_and_explicit_org_survive_optional_403s() {
     );
     let request = &http.requests.lock().unwrap()[0];
     assert_eq!(request.url, "https://api.github.com/user");
-    assert_eq!(request.headers["Authorization"], "Bearer selected-token");
-    assert_eq!(request.headers["Accept"], "application/vnd.github+json");
-    assert_eq!(request.headers["X-GitHub-Api-Version"], "2026-03-10");
-    assert_eq!(request.headers["User-Agent"], "limitwatch");
+    assert_github_headers(request, "selected-token");
     assert_eq!(logged_in.email, "Selected-User");
     assert_eq!(logged_in.extra["github_account"], "Selected-User");
     assert_eq!(logged_in.extra["github_selected_account"], "selected-user");
@@ -372,42 +409,19 @@ fn github_selected_identity_and_explicit_org_survive_optional_403s() {
 
 #[test]
 fn github_internal_user_is_first_single_call_and_selects_configured_org() {
-    let fixture: Value = serde_json::from_str(include_str!(
-        "fixtures/github_copilot/myriota_internal_user.json"
-    ))
-    .unwrap();
-    let mut responses = vec![HttpResponse {
-        status: 200,
-        body: fixture,
-        headers: Default::default(),
-    }];
-    responses.extend((0..4).map(|_| HttpResponse {
-        status: 404,
-        body: json!({"message":"Not Found"}),
-        headers: Default::default(),
-    }));
-    let http = Http {
-        responses: Mutex::new(responses),
-        requests: Mutex::new(vec![]),
-    };
-    let mut saved = account("github_copilot");
-    saved.email = "user".into();
-    saved
-        .extra
-        .insert("githubToken".into(), json!("sanitized-token"));
-    saved.extra.insert("organization".into(), json!("myriota"));
-    let mut provider = providers::create(saved).unwrap();
-    let quotas =
-        futures::executor::block_on(provider.fetch(&http, &Proc, &RequestContext::default()))
-            .unwrap();
+    let fixture = github_fixture!("myriota_internal_user");
+    let http = org_routes(response(200, fixture), not_found());
+    let mut provider = github_provider("user", "sanitized-token", "myriota");
+    let quotas = fetch(provider.as_mut(), &http).unwrap();
     let org = quotas.iter().find(|q| q.display_name == "myriota").unwrap();
     assert!(!quotas.iter().any(|q| q.display_name == "Personal"));
     assert_eq!(org.name, "GitHub Copilot Org (myriota)");
     assert_eq!(org.limit, Some(26000.0));
     assert_eq!(org.used, Some(231.3));
     assert_eq!(org.remaining, Some(25768.7));
-    assert!((org.used_pct.unwrap() - 0.8896153846153846).abs() < f64::EPSILON);
-    assert!((org.remaining_pct.unwrap() - 99.11038461538462).abs() < f64::EPSILON);
+    // Literal expectations, so the parser is not checked against its own formula.
+    assert_close(org.used_pct, 0.8896153846153846);
+    assert_close(org.remaining_pct, 99.11038461538462);
     assert_eq!(org.reset_time.as_deref(), Some("2026-08-01T00:00:00Z"));
     let requests = http.requests.lock().unwrap();
     assert_eq!(
@@ -433,29 +447,9 @@ fn github_internal_user_malformed_or_no_match_falls_back_to_billing() {
             "quota_snapshots":{"premium_interactions":{"entitlement":300,"remaining":68.7}}
         }),
     ] {
-        let missing = || HttpResponse {
-            status: 404,
-            body: json!({"message":"Not Found"}),
-            headers: Default::default(),
-        };
-        let mut responses = vec![HttpResponse {
-            status: 200,
-            body,
-            headers: Default::default(),
-        }];
-        responses.extend((0..8).map(|_| missing()));
-        let http = Http {
-            responses: Mutex::new(responses),
-            requests: Mutex::new(vec![]),
-        };
-        let mut saved = account("github_copilot");
-        saved.email = "user".into();
-        saved.extra.insert("githubToken".into(), json!("token"));
-        saved.extra.insert("organization".into(), json!("Myriota"));
-        let mut provider = providers::create(saved).unwrap();
-        let quotas =
-            futures::executor::block_on(provider.fetch(&http, &Proc, &RequestContext::default()))
-                .unwrap();
+        let http = org_routes(response(200, body), not_found());
+        let mut provider = github_provider("user", "token", "Myriota");
+        let quotas = fetch(provider.as_mut(), &http).unwrap();
         assert_eq!(
             quotas
                 .iter()
@@ -484,48 +478,23 @@ fn github_internal_user_malformed_or_no_match_falls_back_to_billing() {
 
 #[test]
 fn github_reloaded_work_account_fetches_only_myriota_endpoints() {
-    let usage = json!({"usageItems":[{"product":"Copilot premium requests","grossQuantity":2.0}]});
-    let http = Http {
-        responses: Mutex::new(vec![
-            HttpResponse {
-                status: 200,
-                body: json!({"copilot_plan":"pro"}),
-                headers: Default::default(),
-            },
-            HttpResponse {
-                status: 200,
-                body: usage,
-                headers: Default::default(),
-            },
-            HttpResponse {
-                status: 200,
-                body: json!({"usageItems":[{"product":"Copilot premium requests","grossQuantity":2.0}]}),
-                headers: Default::default(),
-            },
-            HttpResponse {
-                status: 200,
-                body: json!({"seat_breakdown":{"total":2},"plan_type":"business"}),
-                headers: Default::default(),
-            },
-        ]),
-        requests: Mutex::new(vec![]),
-    };
-    let mut saved = account("github_copilot");
-    saved.email = "Lucashutch".into();
+    let http = org_routes(
+        response(200, json!({"copilot_plan":"pro"})),
+        response(
+            200,
+            json!({"usageItems":[{"product":"Copilot premium requests","grossQuantity":2.0}]}),
+        ),
+    );
+    let mut saved = github_account("Lucashutch", "validated-token", "Myriota");
     saved
         .extra
         .insert("github_account".into(), json!("Lucashutch"));
-    saved
-        .extra
-        .insert("githubToken".into(), json!("validated-token"));
-    saved.extra.insert("organization".into(), json!("Myriota"));
     let reloaded: Account = serde_json::from_value(serde_json::to_value(saved).unwrap()).unwrap();
     let mut provider = providers::create(reloaded).unwrap();
-    let quotas =
-        futures::executor::block_on(provider.fetch(&http, &Proc, &RequestContext::default()))
-            .unwrap();
+    let quotas = fetch(provider.as_mut(), &http).unwrap();
     assert_eq!(quotas.len(), 1);
     let requests = http.requests.lock().unwrap();
+    assert_eq!(requests.len(), 3);
     assert_eq!(
         requests[0].url,
         "https://api.github.com/copilot_internal/user"
@@ -549,44 +518,14 @@ fn github_reloaded_work_account_fetches_only_myriota_endpoints() {
 
 #[test]
 fn github_billing_request_sequence() {
-    let fixture: Value = serde_json::from_str(include_str!(
-        "fixtures/github_copilot/myriota_billing_requests.json"
-    ))
-    .unwrap();
-    let empty = || HttpResponse {
-        status: 200,
-        body: json!({"usageItems":[]}),
-        headers: Default::default(),
-    };
-    let usage = || HttpResponse {
-        status: 200,
-        body: json!({"usageItems":[{"product":"Copilot AI credits","grossQuantity":2.0}]}),
-        headers: Default::default(),
-    };
-    let mut responses = vec![HttpResponse {
-        status: 200,
-        body: json!({"copilot_plan":"pro"}),
-        headers: Default::default(),
-    }];
-    responses.extend([empty(), empty(), usage()]);
-    responses.extend([empty(), empty(), usage()]);
-    responses.push(HttpResponse {
-        status: 200,
-        body: json!({"seat_breakdown":{"total":2},"plan_type":"business"}),
-        headers: Default::default(),
-    });
-    let http = Http {
-        responses: Mutex::new(responses),
-        requests: Mutex::new(vec![]),
-    };
-    let mut saved = account("github_copilot");
-    saved.email = "Lucashutch".into();
-    saved
-        .extra
-        .insert("githubToken".into(), json!("validated-token"));
-    saved.extra.insert("organization".into(), json!("Myriota"));
-    let mut provider = providers::create(saved).unwrap();
-    futures::executor::block_on(provider.fetch(&http, &Proc, &RequestContext::default())).unwrap();
+    let fixture = github_fixture!("myriota_billing_requests");
+    let mut responses = vec![response(200, json!({"copilot_plan":"pro"}))];
+    responses.extend([empty_usage(), empty_usage(), ai_credits_usage()]);
+    responses.extend([empty_usage(), empty_usage(), ai_credits_usage()]);
+    responses.push(business_seats());
+    let http = Http::new(responses);
+    let mut provider = github_provider("Lucashutch", "validated-token", "Myriota");
+    fetch(provider.as_mut(), &http).unwrap();
 
     let requests = http.requests.lock().unwrap();
     assert_eq!(
@@ -595,9 +534,8 @@ fn github_billing_request_sequence() {
     );
     let billing = requests
         .iter()
-        .filter(|r| r.url.contains("/settings/billing/usage"))
-        .collect::<Vec<_>>();
-    for (index, request) in billing.iter().enumerate() {
+        .filter(|r| r.url.contains("/settings/billing/usage"));
+    for (index, request) in billing.enumerate() {
         let (path, query) = request
             .url
             .strip_prefix("https://api.github.com")
@@ -622,10 +560,7 @@ fn github_billing_request_sequence() {
             assert!(query.contains("start_date=") && query.contains("end_date="));
         }
         assert_eq!(request.method, "GET");
-        assert_eq!(request.headers["Authorization"], "Bearer validated-token");
-        assert_eq!(request.headers["Accept"], "application/vnd.github+json");
-        assert_eq!(request.headers["X-GitHub-Api-Version"], "2026-03-10");
-        assert_eq!(request.headers["User-Agent"], "limitwatch");
+        assert_github_headers(request, "validated-token");
     }
     assert_eq!(
         requests[0]
@@ -645,48 +580,20 @@ fn github_billing_request_sequence() {
 
 #[test]
 fn github_billing_404_fallback() {
-    let fixture: Value = serde_json::from_str(include_str!(
-        "fixtures/github_copilot/myriota_billing_404_fallback.json"
-    ))
-    .unwrap();
-    let empty = || HttpResponse {
-        status: 200,
-        body: json!({"usageItems":[]}),
-        headers: Default::default(),
-    };
-    let missing = || HttpResponse {
-        status: 404,
-        body: json!({"message":"Not Found"}),
-        headers: Default::default(),
-    };
+    let fixture = github_fixture!("myriota_billing_404_fallback");
     for all_missing in [false, true] {
-        let mut responses = vec![empty()]; // /copilot_internal/user
+        let mut responses = vec![empty_usage()]; // /copilot_internal/user
         responses.extend(if all_missing {
-            vec![missing(), missing(), missing(), missing()]
+            vec![not_found(), not_found(), not_found(), not_found()]
         } else {
-            vec![missing(), empty(), missing(), empty()]
+            vec![not_found(), empty_usage(), not_found(), empty_usage()]
         });
         if !all_missing {
-            responses.push(HttpResponse {
-                status: 200,
-                body: json!({"seat_breakdown":{"total":2},"plan_type":"business"}),
-                headers: Default::default(),
-            });
+            responses.push(business_seats());
         }
-        let http = Http {
-            responses: Mutex::new(responses),
-            requests: Mutex::new(vec![]),
-        };
-        let mut saved = account("github_copilot");
-        saved.email = "Lucashutch".into();
-        saved
-            .extra
-            .insert("githubToken".into(), json!("validated-token"));
-        saved.extra.insert("organization".into(), json!("Myriota"));
-        let mut provider = providers::create(saved).unwrap();
-        let quotas =
-            futures::executor::block_on(provider.fetch(&http, &Proc, &RequestContext::default()))
-                .unwrap();
+        let http = Http::new(responses);
+        let mut provider = github_provider("Lucashutch", "validated-token", "Myriota");
+        let quotas = fetch(provider.as_mut(), &http).unwrap();
         let org = quotas.iter().find(|q| q.display_name == "Myriota").unwrap();
         assert_eq!(
             org.extra.get("is_error").and_then(Value::as_bool),
@@ -717,24 +624,100 @@ fn github_billing_404_fallback() {
 
 #[test]
 fn github_identity_validation_failure_is_not_treated_as_optional() {
-    let http = Http {
-        responses: Mutex::new(vec![HttpResponse {
-            status: 403,
-            body: json!({"message":"Forbidden"}),
-            headers: Default::default(),
-        }]),
-        requests: Mutex::new(vec![]),
-    };
+    for (status, body, message) in [
+        (
+            403,
+            json!({"message":"Forbidden"}),
+            "GitHub token validation failed (HTTP 403): Forbidden Check token scopes, rate limits, and organization SSO authorization.",
+        ),
+        (
+            401,
+            json!({"message":"Bad credentials"}),
+            "GitHub token validation failed (HTTP 401): Bad credentials",
+        ),
+        (
+            500,
+            Value::Null,
+            "GitHub token validation failed (HTTP 500): GitHub returned no usable error details",
+        ),
+    ] {
+        let http = Http::new(vec![response(status, body)]);
+        let mut provider = providers::create(account("github_copilot")).unwrap();
+        let error = futures::executor::block_on(provider.login(
+            json!({"githubToken":"identity-token", "organization":"Myriota"}),
+            &http,
+            &Proc,
+            &RequestContext::default(),
+        ))
+        .unwrap_err();
+        assert_eq!(error.to_string(), message);
+    }
+}
+
+#[test]
+fn github_organization_discovery_sorts_logins_and_ignores_failures() {
+    use limitwatch::providers::github_copilot::GitHubCopilotProvider;
+
+    for (status, body, expected) in [
+        (
+            200,
+            json!([{"login":"zeta"}, {"login":"Myriota"}, {"id":1}]),
+            vec!["Myriota", "zeta"],
+        ),
+        (200, json!([]), vec![]),
+        (401, json!({"message":"Bad credentials"}), vec![]),
+    ] {
+        let http = Http::new(vec![response(status, body)]);
+        let orgs =
+            GitHubCopilotProvider::discover_organizations(&http, "token", &Default::default())
+                .unwrap();
+        assert_eq!(orgs, expected);
+        let requests = http.requests.lock().unwrap();
+        assert_eq!(
+            requests[0].url,
+            "https://api.github.com/user/orgs?per_page=100"
+        );
+        assert_eq!(requests[0].headers["Authorization"], "Bearer token");
+    }
+}
+
+#[test]
+fn github_org_billing_statuses_become_quotas_or_error_rows() {
+    for status in [200, 403, 404] {
+        let usage = if status == 200 {
+            ai_credits_usage()
+        } else {
+            response(status, json!({"message":"Denied"}))
+        };
+        let http = org_routes(not_found(), usage);
+        let mut provider = github_provider("user", "token", "Myriota");
+        let quotas = fetch(provider.as_mut(), &http).unwrap();
+        assert_eq!(quotas.len(), 1);
+        let org = &quotas[0];
+        assert_eq!(org.name, "GitHub Copilot Org (Myriota)");
+        if status == 200 {
+            assert_eq!(org.used, Some(2.0));
+            assert!(!org.extra.contains_key("is_error"));
+        } else {
+            assert_eq!(org.extra["is_error"], true);
+            let message = org.extra["message"].as_str().unwrap();
+            assert!(message.contains(&format!("HTTP {status}")));
+            assert!(message.contains("Denied"));
+        }
+    }
+}
+
+#[test]
+fn github_login_without_token_or_gh_fails_without_a_request() {
+    let http = Http::new(vec![]);
     let mut provider = providers::create(account("github_copilot")).unwrap();
     let error = futures::executor::block_on(provider.login(
-        json!({"githubToken":"identity-token", "organization":"Myriota"}),
+        json!({}),
         &http,
         &Proc,
         &RequestContext::default(),
     ))
     .unwrap_err();
-    assert_eq!(
-        error.to_string(),
-        "GitHub token validation failed (HTTP 403): Forbidden Check token scopes, rate limits, and organization SSO authorization."
-    );
+    assert!(error.to_string().contains("gh not installed"));
+    assert!(http.requests.lock().unwrap().is_empty());
 }